@@ -2,6 +2,7 @@ package main
 
 import (
 	"context"
+	"encoding/hex"
 	"errors"
 	"flag"
 	"fmt"
@@ -9,28 +10,40 @@ import (
 	"math/rand"
 	"os"
 	"os/exec"
-	"os/user"
+	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	batchv1 "k8s.io/api/batch/v1"
 	corev1 "k8s.io/api/core/v1"
 	v1 "k8s.io/api/core/v1"
 	rbac "k8s.io/api/rbac/v1"
+	apierrors "k8s.io/apimachinery/pkg/api/errors"
 	"k8s.io/apimachinery/pkg/api/resource"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
+	"k8s.io/apimachinery/pkg/fields"
 	"k8s.io/apimachinery/pkg/types"
+	"k8s.io/apimachinery/pkg/watch"
 	"k8s.io/client-go/kubernetes"
 	"k8s.io/client-go/tools/clientcmd"
 )
 
+// The control plane nodes are found, scheduled onto and tolerated by this label
+const masterNodeLabel = "node-role.kubernetes.io/master"
+
+func init() {
+	// Seed the generator once at start up rather than every time a random string is needed
+	rand.Seed(time.Now().UnixNano())
+}
+
 func randomString(length int) string {
 	// Generate a random uuid to attach to the pod name
 	// so that this can be called multiple times without conflicting with previous runs
-	rand.Seed(time.Now().UnixNano())
-	b := make([]byte, length)
+	// Each byte encodes to two hex characters so only half as many random bytes are needed
+	b := make([]byte, (length+1)/2)
 	rand.Read(b)
-	return fmt.Sprintf("%x", b)[:length]
+	return hex.EncodeToString(b)[:length]
 }
 
 func createClusterBackupRole(namespaceName string, client *kubernetes.Clientset) {
@@ -71,13 +84,10 @@ func createClusterPriviligedRole(namespaceName string, client *kubernetes.Client
 		Rules: rules,
 	}
 
-	_, exist_err := client.RbacV1().ClusterRoles().Get(context.TODO(), roleName, metav1.GetOptions{})
-	if exist_err != nil {
-		_, err := client.RbacV1().ClusterRoles().Create(context.TODO(), clusterRole, metav1.CreateOptions{})
+	_, err := client.RbacV1().ClusterRoles().Create(context.TODO(), clusterRole, metav1.CreateOptions{})
 
-		if err != nil {
-			panic(err)
-		}
+	if err != nil && !apierrors.IsAlreadyExists(err) {
+		panic(err)
 	}
 }
 
@@ -128,13 +138,10 @@ func createServiceAccount(namespaceName string, serviceAccountName string, clien
 			Namespace: namespaceName,
 		},
 	}
-	_, exist_err := client.CoreV1().ServiceAccounts(namespaceName).Get(context.TODO(), serviceAccountName, metav1.GetOptions{})
-	if exist_err != nil {
-		_, err := client.CoreV1().ServiceAccounts(namespaceName).Create(context.TODO(), serviceAccount, metav1.CreateOptions{})
+	_, err := client.CoreV1().ServiceAccounts(namespaceName).Create(context.TODO(), serviceAccount, metav1.CreateOptions{})
 
-		if err != nil {
-			panic(err)
-		}
+	if err != nil && !apierrors.IsAlreadyExists(err) {
+		panic(err)
 	}
 }
 
@@ -150,18 +157,15 @@ func createProject(namespaceName string, serviceAccountName string, debug bool,
 			},
 		},
 	}
-	_, exist_err := client.CoreV1().Namespaces().Get(context.TODO(), namespaceName, metav1.GetOptions{})
-	if debug {
+	_, createNamespaceError := client.CoreV1().Namespaces().Create(context.TODO(), namespace, metav1.CreateOptions{})
+
+	if createNamespaceError == nil && debug {
 		fmt.Printf("%s project: %s did not exist\n", debug_header, namespaceName)
-		fmt.Printf("%s creating the project %s\n", debug_header, namespaceName)
+		fmt.Printf("%s created the project %s\n", debug_header, namespaceName)
 	}
-	if exist_err != nil {
-		_, createNamespaceError := client.CoreV1().Namespaces().Create(context.TODO(), namespace, metav1.CreateOptions{})
-
-		if createNamespaceError != nil {
-			fmt.Println("Failed to create namespace")
-			panic(createNamespaceError)
-		}
+	if createNamespaceError != nil && !apierrors.IsAlreadyExists(createNamespaceError) {
+		fmt.Println("Failed to create namespace")
+		panic(createNamespaceError)
 	}
 	fmt.Println("Creating service account...")
 	createServiceAccount(namespaceName, serviceAccountName, client)
@@ -175,6 +179,15 @@ func createProject(namespaceName string, serviceAccountName string, debug bool,
 
 }
 
+func splitTaint(taintName string) (string, string) {
+	// A taint is passed in as either "key" or "key=value"
+	// only the first "=" separates the two
+	if i := strings.Index(taintName, "="); i >= 0 {
+		return taintName[:i], taintName[i+1:]
+	}
+	return taintName, ""
+}
+
 func createBackupPodNoPVC(nodeName string, projectName string, imageURL string, jobName string, serviceAccountName string, taintName string, debug bool, debug_header string) *batchv1.Job {
 	// Creates a debug pod from the nodeName passed in
 	// Pod is based on the ose-cli pod and runs an etcd backup
@@ -188,14 +201,7 @@ func createBackupPodNoPVC(nodeName string, projectName string, imageURL string,
 	backupCMD := cmd + " /usr/local/bin/cluster-backup.sh " + tempBackupDir
 	tarCMD := cmd + " tar czf " + tempTarball + " " + tempBackupDir
 
-	taintKey := taintName
-	taintVal := ""
-
-	if strings.Contains(taintName, "=") {
-		splitVar := strings.Split(taintName, "=")
-		taintKey = splitVar[0]
-		taintVal = splitVar[1]
-	}
+	taintKey, taintVal := splitTaint(taintName)
 
 	// using cat to stream the tarball from one host to another is one way to transfer without mounting
 	// any mounts on the debug host
@@ -228,7 +234,7 @@ func createBackupPodNoPVC(nodeName string, projectName string, imageURL string,
 					RestartPolicy:      corev1.RestartPolicyNever,
 					ServiceAccountName: serviceAccountName,
 					NodeSelector: map[string]string{
-						"node-role.kubernetes.io/master": "",
+						masterNodeLabel: "",
 					},
 				},
 			},
@@ -253,102 +259,58 @@ func createBackupPodWithPVC(nodeName string, projectName string, imageURL string
 
 	priv := true
 
-	taintKey := taintName
-	taintVal := ""
-
-	if strings.Contains(taintName, "=") {
-		splitVar := strings.Split(taintName, "=")
-		taintKey = splitVar[0]
-		taintVal = splitVar[1]
-	}
+	taintKey, taintVal := splitTaint(taintName)
 
 	// using cat to stream the tarball from one host to another is one way to transfer without mounting
 	// any mounts on the debug host
-	copyFirstTarball := cmd + " cat " + tempTarball + " > /backups/backup_$(date +%Y-%m-%d_%H-%M_%Z).db.tgz"
 	cleanupCMD := cmd + " rm -rfv " + tempBackupDir + " && " + cmd + " rm -f " + tempTarball
-	fullBackupCMD := []string{
-		"/bin/bash",
-		"-c",
-		backupCMD + " && " + tarCMD + " && " + copyFirstTarball + " && " + cleanupCMD,
-	}
 
-	// We need to define the mount and volume before hand so that in the event there are 2 mount points
-	// We can create the definition for the mounts before the pod definition and just pass the mounts in
-	volumeDef := []corev1.Volume{}
-	mountDef := []corev1.VolumeMount{
-		corev1.VolumeMount{
-			Name:      "etcd-backup-mount",
-			MountPath: "/backups",
-		},
-	}
+	claimNames := []string{}
 	if firstPVCName != "" {
 		if debug {
 			fmt.Printf("%s First PVC Name: %s\n", debug_header, firstPVCName)
 		}
-		volumeDef = []corev1.Volume{
-			{
-				Name: "etcd-backup-mount",
-				VolumeSource: corev1.VolumeSource{
-					PersistentVolumeClaim: &corev1.PersistentVolumeClaimVolumeSource{
-						ClaimName: firstPVCName,
-					},
-				},
-			},
-		}
+		claimNames = append(claimNames, firstPVCName)
 	}
-
 	if secondPVCName != "" {
 		if debug {
 			fmt.Printf("%s Second PVC Name: %s\n", debug_header, secondPVCName)
 		}
-		volumeDef = []corev1.Volume{
-			{
-				Name: "etcd-backup-mount",
-				VolumeSource: corev1.VolumeSource{
-					PersistentVolumeClaim: &corev1.PersistentVolumeClaimVolumeSource{
-						ClaimName: secondPVCName,
-					},
-				},
-			},
-		}
+		claimNames = append(claimNames, secondPVCName)
 	}
 
-	// if we have both a dynamic and an NFS PVC defined we want to define the pod to have both
-	if firstPVCName != "" && secondPVCName != "" {
-		copySecondTarballCMD := cmd + " cat " + tempTarball + " > /backups2/backup_$(date +%Y-%m-%d_%H-%M_%Z).db.tgz"
-		fullBackupCMD = []string{
-			"/bin/bash",
-			"-c",
-			backupCMD + " && " + tarCMD + " && " + copyFirstTarball + " && " + copySecondTarballCMD + " && " + cleanupCMD,
-		}
-		mountDef = []corev1.VolumeMount{
-			corev1.VolumeMount{
-				Name:      "etcd-backup-mount",
-				MountPath: "/backups",
-			},
-			corev1.VolumeMount{
-				Name:      "etcd-backup-mount2",
-				MountPath: "/backups2",
-			},
-		}
-		volumeDef = []corev1.Volume{
-			{
-				Name: "etcd-backup-mount",
-				VolumeSource: corev1.VolumeSource{
-					PersistentVolumeClaim: &corev1.PersistentVolumeClaimVolumeSource{
-						ClaimName: firstPVCName,
-					},
-				},
-			},
-			{
-				Name: "etcd-backup-mount2",
-				VolumeSource: corev1.VolumeSource{
-					PersistentVolumeClaim: &corev1.PersistentVolumeClaimVolumeSource{
-						ClaimName: secondPVCName,
-					},
+	// Every claim gets a volume, a mount and its own copy of the tarball
+	// The first claim is mounted on /backups and, if we have both a dynamic and an NFS PVC, the second on /backups2
+	// Building all three from the one list avoids spelling out the volumes for each combination of claims
+	volumeDef := []corev1.Volume{}
+	mountDef := []corev1.VolumeMount{}
+	backupSteps := []string{backupCMD, tarCMD}
+	for i, claimName := range claimNames {
+		suffix := ""
+		if i > 0 {
+			suffix = strconv.Itoa(i + 1)
+		}
+		volumeName := "etcd-backup-mount" + suffix
+		mountPath := "/backups" + suffix
+		volumeDef = append(volumeDef, corev1.Volume{
+			Name: volumeName,
+			VolumeSource: corev1.VolumeSource{
+				PersistentVolumeClaim: &corev1.PersistentVolumeClaimVolumeSource{
+					ClaimName: claimName,
 				},
 			},
-		}
+		})
+		mountDef = append(mountDef, corev1.VolumeMount{
+			Name:      volumeName,
+			MountPath: mountPath,
+		})
+		backupSteps = append(backupSteps, cmd+" cat "+tempTarball+" > "+mountPath+"/backup_$(date +%Y-%m-%d_%H-%M_%Z).db.tgz")
+	}
+	backupSteps = append(backupSteps, cleanupCMD)
+	fullBackupCMD := []string{
+		"/bin/bash",
+		"-c",
+		strings.Join(backupSteps, " && "),
 	}
 
 	jobSpec := &batchv1.Job{
@@ -382,7 +344,7 @@ func createBackupPodWithPVC(nodeName string, projectName string, imageURL string
 					Volumes:            volumeDef,
 
 					NodeSelector: map[string]string{
-						"node-role.kubernetes.io/master": "",
+						masterNodeLabel: "",
 					},
 				},
 			},
@@ -443,51 +405,34 @@ func createPersistentNFSVolume(namespaceName string, nfsServer string, nfsPath s
 	// If the claim is already bound, don't touch the PV
 	claimOutput, _ := client.CoreV1().PersistentVolumeClaims(namespaceName).Get(context.TODO(), claimName, metav1.GetOptions{})
 	if claimOutput.Status.Phase == "Bound" {
-		fmt.Printf("%s PVC is already bound to the PV... No action taken\n", debug_header)
+		if debug {
+			fmt.Printf("%s PVC is already bound to the PV... No action taken\n", debug_header)
+		}
 		return
 	}
 	// Because OCP adds resource versions and uuid, if the PVC gets deleted for some reason, the PV will never become bound
 	// Therefore we want to update the PV definition to remove UUID and resource version information
 	_, updatePVError := client.CoreV1().PersistentVolumes().Update(context.TODO(), volumeSpec, metav1.UpdateOptions{})
-	fmt.Printf("%s the PV has been updated with the new PVC\n", debug_header)
 	if updatePVError != nil {
 		fmt.Println("Failed to update Persistent Volume...")
 		panic(updatePVError)
 	}
+	if debug {
+		fmt.Printf("%s the PV has been updated with the new PVC\n", debug_header)
+	}
 }
 
 func createPVCDefinition(namespaceName string, pvcName string, volumeName string, volumeSize string, accessMode []corev1.PersistentVolumeAccessMode) ([]corev1.PersistentVolumeAccessMode, *corev1.PersistentVolumeClaim) {
 	// Return a different PVC Spec depending on whether or not a volumeName is passed in
 	// The assumption is that a PVC without an explicite volume name is intended to be dynamic storage backed
 	// The accessMode is also returned
-	pvcSpec := &corev1.PersistentVolumeClaim{}
-	if volumeName == "" {
-		pvcSpec = &corev1.PersistentVolumeClaim{
-			ObjectMeta: metav1.ObjectMeta{
-				Name:      pvcName,
-				Namespace: namespaceName,
-				UID:       types.UID(pvcName),
-			},
-			Spec: corev1.PersistentVolumeClaimSpec{
-				AccessModes: accessMode,
-				Resources: corev1.ResourceRequirements{
-					Requests: corev1.ResourceList{
-						corev1.ResourceName(corev1.ResourceStorage): resource.MustParse(volumeSize),
-					},
-				},
-			},
-			Status: corev1.PersistentVolumeClaimStatus{
-				Phase:       corev1.ClaimBound,
-				AccessModes: accessMode,
-				Capacity: corev1.ResourceList{
-					corev1.ResourceName(corev1.ResourceStorage): resource.MustParse(volumeSize),
-				},
-			},
-		}
-		return accessMode, pvcSpec
+	// The two kinds of claim only differ in their access mode and volume name, so build a single spec
+	// and parse the requested size once for both the request and the capacity
+	if volumeName != "" {
+		accessMode = []corev1.PersistentVolumeAccessMode{corev1.ReadWriteMany}
 	}
-	accessMode = []corev1.PersistentVolumeAccessMode{corev1.ReadWriteMany}
-	pvcSpec = &corev1.PersistentVolumeClaim{
+	storageSize := resource.MustParse(volumeSize)
+	pvcSpec := &corev1.PersistentVolumeClaim{
 		ObjectMeta: metav1.ObjectMeta{
 			Name:      pvcName,
 			Namespace: namespaceName,
@@ -497,7 +442,7 @@ func createPVCDefinition(namespaceName string, pvcName string, volumeName string
 			AccessModes: accessMode,
 			Resources: corev1.ResourceRequirements{
 				Requests: corev1.ResourceList{
-					corev1.ResourceName(corev1.ResourceStorage): resource.MustParse(volumeSize),
+					corev1.ResourceName(corev1.ResourceStorage): storageSize,
 				},
 			},
 			VolumeName: volumeName,
@@ -506,13 +451,62 @@ func createPVCDefinition(namespaceName string, pvcName string, volumeName string
 			Phase:       corev1.ClaimBound,
 			AccessModes: accessMode,
 			Capacity: corev1.ResourceList{
-				corev1.ResourceName(corev1.ResourceStorage): resource.MustParse(volumeSize),
+				corev1.ResourceName(corev1.ResourceStorage): storageSize,
 			},
 		},
 	}
 	return accessMode, pvcSpec
 }
 
+func waitForPVCDeletion(namespaceName string, pvcName string, timeoutSeconds int64, debug bool, debug_header string, client *kubernetes.Clientset) bool {
+	// Watch the PVC instead of sleeping so that we return as soon as the finalizers let it go
+	// The watch starts from the resource version we just read so the delete event cannot be missed
+	// If the watch ends early (dropped connection, expired resource version) the claim is read again and watched from there until the deadline
+	deadline := time.Now().Add(time.Duration(timeoutSeconds) * time.Second)
+	for {
+		claimOutput, getPVCError := client.CoreV1().PersistentVolumeClaims(namespaceName).Get(context.TODO(), pvcName, metav1.GetOptions{})
+		if apierrors.IsNotFound(getPVCError) {
+			return true
+		}
+		// false is kept for "still terminating", anything else is a real error and is reported as one
+		if getPVCError != nil {
+			fmt.Printf("Error getting PVC %s\n", pvcName)
+			panic(getPVCError)
+		}
+		remaining := time.Until(deadline)
+		if remaining <= 0 {
+			return false
+		}
+		remainingSeconds := int64(remaining/time.Second) + 1
+		pvcWatch, watchPVCError := client.CoreV1().PersistentVolumeClaims(namespaceName).Watch(context.TODO(), metav1.ListOptions{
+			FieldSelector:   fields.OneTermEqualSelector("metadata.name", pvcName).String(),
+			ResourceVersion: claimOutput.ResourceVersion,
+			TimeoutSeconds:  &remainingSeconds,
+		})
+		if watchPVCError != nil {
+			fmt.Printf("Error watching PVC %s\n", pvcName)
+			panic(watchPVCError)
+		}
+
+		for event := range pvcWatch.ResultChan() {
+			if debug {
+				fmt.Printf("%s received %s event for PVC %s\n", debug_header, event.Type, pvcName)
+			}
+			if event.Type == watch.Deleted {
+				pvcWatch.Stop()
+				return true
+			}
+			if event.Type == watch.Error {
+				fmt.Printf("Watch on PVC %s ended early: %s\n", pvcName, apierrors.FromObject(event.Object))
+				break
+			}
+		}
+		pvcWatch.Stop()
+		// a short pause so a watch that keeps failing doesn't hammer the API server
+		time.Sleep(time.Second)
+	}
+}
+
 func createMissingPVCs(namespaceName string, nfsPVCName string, volumeName string, volumeSize string, debug bool, debug_header string, client *kubernetes.Clientset) {
 	//This function will create a PVC if it doesn't exist already
 	// Additionally, it will check to make sure that the PVC is not lost
@@ -522,20 +516,17 @@ func createMissingPVCs(namespaceName string, nfsPVCName string, volumeName strin
 	claimOutput, exist_err := client.CoreV1().PersistentVolumeClaims(namespaceName).Get(context.TODO(), nfsPVCName, metav1.GetOptions{})
 	if claimOutput.Status.Phase == "Lost" {
 		deletePVCError := client.CoreV1().PersistentVolumeClaims(namespaceName).Delete(context.TODO(), nfsPVCName, metav1.DeleteOptions{})
-		i := 0
-		// We want to wait up to 30 seconds for a terminating PVC to be removed
-		for i <= 3 {
-			claimOutput, _ := client.CoreV1().PersistentVolumeClaims(namespaceName).Get(context.TODO(), nfsPVCName, metav1.GetOptions{})
-			if claimOutput.Status.Phase != "Terminating" {
-				time.Sleep(10 * time.Second)
-			}
-
-			i++
-		}
 		if deletePVCError != nil {
 			fmt.Println("The PVC was in a 'Lost' state but it could not be removed. Please investigate")
 			panic(deletePVCError)
 		}
+		// We want to wait up to 30 seconds for a terminating PVC to be removed
+		if !waitForPVCDeletion(namespaceName, nfsPVCName, 30, debug, debug_header, client) {
+			panic("The PVC was in a 'Lost' state and is still terminating after 30 seconds. Please investigate")
+		}
+		// The lost claim is gone so it needs to be recreated below
+		claimOutput = &corev1.PersistentVolumeClaim{}
+		createPVC = true
 	}
 
 	// go get the PVC Sepc
@@ -559,32 +550,88 @@ func createMissingPVCs(namespaceName string, nfsPVCName string, volumeName strin
 		if debug {
 			fmt.Printf("%s Attempting to create the PVC: %s\n", debug_header, nfsPVCName)
 		}
-		_, createPVCError := client.CoreV1().PersistentVolumeClaims(namespaceName).Create(context.TODO(), pvcSpec, metav1.CreateOptions{})
+		createdPVC, createPVCError := client.CoreV1().PersistentVolumeClaims(namespaceName).Create(context.TODO(), pvcSpec, metav1.CreateOptions{})
 
 		if createPVCError != nil {
 			fmt.Println("Failed to create PVC")
 			panic(createPVCError)
 		}
-		i := 0
 		// Wait for up to 100 seconds for the PVC to become bound
-		for i <= 10 {
-			claimOutput, _ := client.CoreV1().PersistentVolumeClaims(namespaceName).Get(context.TODO(), nfsPVCName, metav1.GetOptions{})
-			if claimOutput.Status.Phase != "Bound" {
-				time.Sleep(10 * time.Second)
-				timeElapsed := i * 10
-				fmt.Printf("PVC is not yet bound after %d\n", timeElapsed)
+		// If we cannot bind to a PV, halt the program
+		if !waitForPVCBound(namespaceName, nfsPVCName, createdPVC.ResourceVersion, 100, debug, debug_header, client) {
+			panic("Problem binding PVC to a PV... exiting")
+		}
+	}
+
+}
+
+func waitForPVCBound(namespaceName string, pvcName string, resourceVersion string, timeoutSeconds int64, debug bool, debug_header string, client *kubernetes.Clientset) bool {
+	// Watch the claim from the version we created instead of polling it every 10 seconds
+	// so that we carry on as soon as the claim is bound
+	// If the watch ends early (dropped connection, expired resource version) the claim is read again and watched from there until the deadline
+	startTime := time.Now()
+	deadline := startTime.Add(time.Duration(timeoutSeconds) * time.Second)
+	for {
+		remaining := time.Until(deadline)
+		if remaining <= 0 {
+			return false
+		}
+		remainingSeconds := int64(remaining/time.Second) + 1
+		pvcWatch, watchPVCError := client.CoreV1().PersistentVolumeClaims(namespaceName).Watch(context.TODO(), metav1.ListOptions{
+			FieldSelector:   fields.OneTermEqualSelector("metadata.name", pvcName).String(),
+			ResourceVersion: resourceVersion,
+			TimeoutSeconds:  &remainingSeconds,
+		})
+		if watchPVCError != nil {
+			fmt.Printf("Error watching PVC %s: %s\n", pvcName, watchPVCError)
+			return false
+		}
+
+		for event := range pvcWatch.ResultChan() {
+			if event.Type == watch.Error {
+				fmt.Printf("Watch on PVC %s ended early: %s\n", pvcName, apierrors.FromObject(event.Object))
+				break
 			}
-			if claimOutput.Status.Phase == "Bound" {
-				return
+			claimOutput, ok := event.Object.(*corev1.PersistentVolumeClaim)
+			if !ok {
+				continue
 			}
-			i++
-			// If we cannot bind to a PV, halt the program
-			if i == 10 {
-				panic("Problem binding PVC to a PV... exiting")
+			if claimOutput.Status.Phase == corev1.ClaimBound {
+				pvcWatch.Stop()
+				return true
 			}
+			// time.Since uses the monotonic clock reading so the elapsed time is measured rather than assumed
+			timeElapsed := time.Since(startTime).Round(time.Second)
+			fmt.Printf("PVC %s is not yet bound after %s\n", pvcName, timeElapsed)
+		}
+		pvcWatch.Stop()
+
+		// the claim may have been bound while the watch was down so read it again before watching on from there
+		claimOutput, getPVCError := client.CoreV1().PersistentVolumeClaims(namespaceName).Get(context.TODO(), pvcName, metav1.GetOptions{})
+		if getPVCError != nil {
+			fmt.Printf("Error getting PVC %s: %s\n", pvcName, getPVCError)
+			return false
+		}
+		if claimOutput.Status.Phase == corev1.ClaimBound {
+			return true
 		}
+		if debug {
+			fmt.Printf("%s watching PVC %s again from resource version %s\n", debug_header, pvcName, claimOutput.ResourceVersion)
+		}
+		resourceVersion = claimOutput.ResourceVersion
+		// a short pause so a watch that keeps failing doesn't hammer the API server
+		time.Sleep(time.Second)
 	}
+}
 
+func ocDebugNodeCommand(nodeName string, kubeconfig string, command ...string) *exec.Cmd {
+	// Builds an "oc debug node/<node> -- <command>" invocation
+	// oc is exec'd directly rather than through "sh -c" so that every argument reaches oc as-is
+	// and the kubeconfig is handed over through the environment instead of a shell prefix
+	args := append([]string{"debug", "node/" + nodeName, "--"}, command...)
+	cmd := exec.Command("oc", args...)
+	cmd.Env = append(os.Environ(), "KUBECONFIG="+kubeconfig)
+	return cmd
 }
 
 func pullBackupLocal(nodeName string, localBackupDirectory string, namespaceName string, jobName string, debug bool, debug_header string, kubeconfig string, client *kubernetes.Clientset) {
@@ -594,23 +641,16 @@ func pullBackupLocal(nodeName string, localBackupDirectory string, namespaceName
 	// tarball should be in our temporary location on the control plane host
 	tempTarball := "/host/tmp/etcd_backup.tar.gz"
 	//tempBackupDir := "/host/tmp/assests"
-	cmd := fmt.Sprintf("KUBECONFIG=%s oc debug node/%s", kubeconfig, nodeName)
-	catCMD := cmd + " -- cat " + tempTarball
-	todayDate := fmt.Sprintf("%d-%d-%d_%d_%d_%d", time.Now().Year(), time.Now().Month(), time.Now().Day(), time.Now().Hour(), time.Now().Minute(), time.Now().Second())
+	// Read the clock once so every field of the timestamp comes from the same instant
+	now := time.Now()
+	todayDate := fmt.Sprintf("%d-%d-%d_%d_%d_%d", now.Year(), now.Month(), now.Day(), now.Hour(), now.Minute(), now.Second())
 	localTarballLocation := localBackupDirectory + "/etcd_backup_" + todayDate + ".db.tgz"
-	// this is a hack to get around the error "arguments in resource/name form may not have more than one slash"
-	// seems to be some weird escaping happening in the exec command
-	// perhaps a better way would be to try and create a debug node pod
-	fmt.Println("Attempint to copy tarball locally...")
-	if debug {
-		fmt.Printf("%s running the following command \n\t\t\t%s\n", debug_header, catCMD)
-	}
-	output, catTarballError := exec.Command("sh", "-c", catCMD).Output()
-	if catTarballError != nil {
-		fmt.Println("Failed to read remote file")
-		log.Fatal(catTarballError)
+	// Make sure the local backup directory exists, MkdirAll is a no-op if it already does
+	if makeDirectoryError := os.MkdirAll(localBackupDirectory, 0755); makeDirectoryError != nil {
+		fmt.Println("Failed to create local backup directory")
+		log.Fatal(makeDirectoryError)
 	}
-	// The output is captured as a byte[] so we want to write this out to a file
+	fmt.Println("Attempint to copy tarball locally...")
 	f, createLocalFileError := os.Create(localTarballLocation)
 
 	if createLocalFileError != nil {
@@ -620,7 +660,22 @@ func pullBackupLocal(nodeName string, localBackupDirectory string, namespaceName
 
 	defer f.Close()
 
-	_, saveFileError := f.Write(output)
+	// Rather than capturing the whole tarball in memory and then writing it out,
+	// hand the file to oc as its stdout so the backup is streamed straight to disk
+	catCMD := ocDebugNodeCommand(nodeName, kubeconfig, "cat", tempTarball)
+	catCMD.Stdout = f
+	catCMD.Stderr = os.Stderr
+	if debug {
+		fmt.Printf("%s running the following command \n\t\t\t%s\n", debug_header, catCMD)
+	}
+	catTarballError := catCMD.Run()
+	if catTarballError != nil {
+		fmt.Println("Failed to read remote file")
+		os.Remove(localTarballLocation)
+		log.Fatal(catTarballError)
+	}
+
+	saveFileError := f.Sync()
 
 	if saveFileError != nil {
 		fmt.Println("Failed to save local file")
@@ -628,48 +683,129 @@ func pullBackupLocal(nodeName string, localBackupDirectory string, namespaceName
 	}
 
 	fmt.Println("Starting cleanup")
-	cleanupCMD := cmd + " -- rm -fv " + tempTarball
+	cleanupCMD := ocDebugNodeCommand(nodeName, kubeconfig, "rm", "-fv", tempTarball)
 	if debug {
 		fmt.Printf("%s using the following cleanup command:\n\t\t\t  %s\n", debug_header, cleanupCMD)
 	}
-	out2, _ := exec.Command("sh", "-c", cleanupCMD).CombinedOutput()
-
-	fmt.Println(string(out2))
+	// The cleanup output is only ever shown to the user, so hand oc our stdout/stderr instead of buffering it
+	cleanupCMD.Stdout = os.Stdout
+	cleanupCMD.Stderr = os.Stderr
+	cleanupCMD.Run()
 	return
 }
 
+func nodeIsReady(node corev1.Node) bool {
+	// Only the Ready condition matters so stop scanning the conditions as soon as it is found
+	for _, condition := range node.Status.Conditions {
+		if condition.Type == corev1.NodeReady {
+			return condition.Status == corev1.ConditionTrue
+		}
+	}
+	return false
+}
+
 func waitForJobComplete(namespaceName string, jobName string, debug bool, debug_header string, nodeName string, client *kubernetes.Clientset) bool {
 	// We want to wait for the backup job to actually complete before we attempt to copy the tarball locally
-	i := 0
+	// Rather than polling the job every 10 seconds, watch it so that a status change is seen as soon as it happens
+	// The watch is bounded by the same 240 seconds the polling loop used to allow
 	success := false
-	for i <= 24 {
-		job, getJobError := client.BatchV1().Jobs(namespaceName).Get(context.TODO(), jobName, metav1.GetOptions{})
+	startTime := time.Now()
+	deadline := startTime.Add(240 * time.Second)
+	// A watch on a job that doesn't exist just sits there until it times out, so read the job first
+	// and fail straight away if it isn't there, the watch then carries on from the version we read
+	job, getJobError := client.BatchV1().Jobs(namespaceName).Get(context.TODO(), jobName, metav1.GetOptions{})
+
+	if getJobError != nil {
+		fmt.Println("Error getting Job... Might not exist?")
+		panic(getJobError)
+	}
+	var jobWatch watch.Interface
+	defer func() {
+		if jobWatch != nil {
+			jobWatch.Stop()
+		}
+	}()
+
+	// The job is modified several times while it runs without the active/succeeded/failed counts changing
+	// only report the progress when those counts actually change so the same line isn't repeated
+	lastCounts := [3]int32{-1, -1, -1}
+	// The job we read is checked first, every pass after that works on the job from the latest watch event
+	for {
+		counts := [3]int32{job.Status.Active, job.Status.Succeeded, job.Status.Failed}
+		if counts != lastCounts {
+			if job.Status.Active == 0 && job.Status.Succeeded == 0 && job.Status.Failed == 0 {
+				fmt.Printf("%s hasn't started yet\n", job.Name)
+			}
 
-		if getJobError != nil {
-			fmt.Println("Error getting Job... Might not exist?")
-			panic(getJobError)
+			if job.Status.Active > 0 {
+				fmt.Printf("%s is still running after %d seconds\n", job.Name, int(time.Since(startTime).Seconds()))
+			}
+			lastCounts = counts
+		}
+		// Succeeded is only counted once the backup pod has exited, by then the tarball has been written
+		// so there is nothing to gain by sleeping before handing back to the caller
+		if job.Status.Succeeded > 0 {
+			success = true
+			break
+		}
+		// The job will not recover once it has been marked as failed so there is no point waiting out the timeout
+		for _, condition := range job.Status.Conditions {
+			if condition.Type == batchv1.JobFailed && condition.Status == corev1.ConditionTrue {
+				fmt.Printf("%s failed: %s\n", job.Name, condition.Message)
+				return success
+			}
 		}
 
-		if job.Status.Active == 0 && job.Status.Succeeded == 0 && job.Status.Failed == 0 {
-			fmt.Printf("%s hasn't started yet\n", job.Name)
+		remaining := time.Until(deadline)
+		if remaining <= 0 {
+			break
+		}
+		if jobWatch == nil {
+			remainingSeconds := int64(remaining/time.Second) + 1
+			newWatch, watchJobError := client.BatchV1().Jobs(namespaceName).Watch(context.TODO(), metav1.ListOptions{
+				FieldSelector:   fields.OneTermEqualSelector("metadata.name", jobName).String(),
+				ResourceVersion: job.ResourceVersion,
+				TimeoutSeconds:  &remainingSeconds,
+			})
+
+			if watchJobError != nil {
+				fmt.Println("Error watching Job...")
+				panic(watchJobError)
+			}
+			jobWatch = newWatch
 		}
 
-		if job.Status.Active > 0 {
-			fmt.Printf("%s is still running after %d seconds\n", job.Name, i*10)
+		event, open := <-jobWatch.ResultChan()
+		if open && debug {
+			fmt.Printf("%s received %s event for job %s\n", debug_header, event.Type, jobName)
 		}
-		if job.Status.Succeeded > 0 {
-			success = true
-			time.Sleep(10 * time.Second)
-			break
+		// The watch can end before the deadline, the connection may drop or the version we watched from may have expired (410 Gone)
+		// read the job again so nothing that happened in the meantime is missed and watch on from there
+		if !open || event.Type == watch.Error {
+			if open {
+				fmt.Printf("Watch on job %s ended early: %s\n", jobName, apierrors.FromObject(event.Object))
+			}
+			jobWatch.Stop()
+			jobWatch = nil
+			// a short pause so a watch that keeps failing doesn't hammer the API server
+			time.Sleep(time.Second)
+			job, getJobError = client.BatchV1().Jobs(namespaceName).Get(context.TODO(), jobName, metav1.GetOptions{})
+			if getJobError != nil {
+				fmt.Println("Error getting Job... Might not exist?")
+				panic(getJobError)
+			}
+			continue
+		}
+		if event.Type == watch.Deleted {
+			fmt.Printf("%s was deleted before it completed\n", jobName)
+			return success
 		}
-		if i > 5 {
-			fmt.Println()
+		if updatedJob, ok := event.Object.(*batchv1.Job); ok {
+			job = updatedJob
 		}
-		time.Sleep(10 * time.Second)
-		i++
 	}
 	if success == false {
-		fmt.Printf("Job did not complete after 240 seconds, something __may__ be wrong. Tarball **MAY** exist on debug node %s but not on localhost", nodeName)
+		fmt.Printf("Job did not complete after %d seconds, something __may__ be wrong. Tarball **MAY** exist on debug node %s but not on localhost", int(time.Since(startTime).Seconds()), nodeName)
 	}
 	return success
 }
@@ -683,7 +819,7 @@ func main() {
 	nfsServer := flag.String("nfs-server", "", "IP or Hostname of the NFS Server")
 	nfsPath := flag.String("nfs-path", "", "NFS Path to save backups to")
 	debug := flag.Bool("debug", false, "Turns on some debug messages")
-	taintName := flag.String("taint", "node-role.kubernetes.io/master", "Specify a taint to ignore so the pod can run on the control plane")
+	taintName := flag.String("taint", masterNodeLabel, "Specify a taint to ignore so the pod can run on the control plane")
 	useNFS := flag.Bool("use-nfs", false, "Denotes whether the PVC uses NFS or not")
 	nfsPVName := flag.String("nfs-volume-name", "etcd-nfs-backup-vol", "NFS Path to save backups to")
 	nfsPVCName := flag.String("nfs-claim-name", "", "NFS PVC claim name which binds to a persistent volume")
@@ -728,6 +864,12 @@ func main() {
 				}
 			}
 		}
+		if !*useNFS && !*useDynamicStorage {
+			flag.Usage()
+			fmt.Println("")
+			fmt.Println("!!! Either -use-nfs or -use-dynamic-storage is required if using a PVC !!!")
+			os.Exit(1)
+		}
 		if *useDynamicStorage {
 			if *dynamicPVCName == "" {
 				*dynamicPVCName = "etcd-dynamic-backup-claim"
@@ -743,39 +885,62 @@ func main() {
 	}
 
 	// This is a temporary holder until I find a better way to pass in this config
-	// If no kubeconfig is passed in, attempt to find it in a default location
-	if *kubeConfigFile == "" {
-		fmt.Println("No kubeconfig attempting to use ~/.kube/auth/kubeconfig")
-		userName, _ := user.Current()
-		kubePath := fmt.Sprintf("/home/%s/.kube/auth/kubeconfig", userName)
-		if _, err := os.Stat(kubePath); errors.Is(err, os.ErrNotExist) {
-			panic("Kubeconfig was not passed in and does not exist in the default location... cannot continue!")
+	// If no kubeconfig is passed in, use $KUBECONFIG or attempt to find it in a default location
+	loadingRules := clientcmd.NewDefaultClientConfigLoadingRules()
+	envKubeConfig := os.Getenv(clientcmd.RecommendedConfigPathEnvVar)
+	if *kubeConfigFile == "" && envKubeConfig != "" {
+		// oc debug is handed the same value so it talks to the same cluster
+		*kubeConfigFile = envKubeConfig
+	} else {
+		if *kubeConfigFile == "" {
+			fmt.Println("No kubeconfig attempting to use ~/.kube/auth/kubeconfig")
+			homeDir, homeDirError := os.UserHomeDir()
+			if homeDirError != nil {
+				fmt.Printf("Could not find the home directory (%s), pass -kube-config or set KUBECONFIG\n", homeDirError)
+				os.Exit(1)
+			}
+			kubePath := homeDir + "/.kube/auth/kubeconfig"
+			if _, err := os.Stat(kubePath); errors.Is(err, os.ErrNotExist) {
+				panic("Kubeconfig was not passed in and does not exist in the default location... cannot continue!")
+			}
+			*kubeConfigFile = kubePath
 		}
-		*kubeConfigFile = "${USER}/.kube/auth/kubeconfig"
+		loadingRules.ExplicitPath = *kubeConfigFile
 	}
 
 	fmt.Println("Connecting to cluster")
 	if *debug {
 		fmt.Printf("%s Connecting using kubeconfig: %s\n", debug_header, *kubeConfigFile)
 	}
-	config, err := clientcmd.BuildConfigFromFlags("", *kubeConfigFile)
+	config, err := clientcmd.NewNonInteractiveDeferredLoadingClientConfig(loadingRules, &clientcmd.ConfigOverrides{}).ClientConfig()
 
 	if err != nil {
 		panic(err)
 	}
 
 	client, _ := kubernetes.NewForConfig(config)
-	fmt.Println("Attempting to find nodes with the label: node-role.kubernetes.io/master=")
-	nodes, err := client.CoreV1().Nodes().List(context.TODO(), metav1.ListOptions{LabelSelector: "node-role.kubernetes.io/master="})
+	fmt.Printf("Attempting to find nodes with the label: %s=\n", masterNodeLabel)
+	// ResourceVersion "0" lets the API server answer from its watch cache instead of a quorum read from etcd
+	nodes, err := client.CoreV1().Nodes().List(context.TODO(), metav1.ListOptions{LabelSelector: masterNodeLabel + "=", ResourceVersion: "0"})
 
 	if err != nil {
 		fmt.Println(err)
 		return
 	}
 
-	// It should be safe to assume that at least 1 item exists since the above error should have exited the program
-	// if no results were found
-	debug_node := nodes.Items[0].Name
+	// oc debug needs a node that can actually run the debug pod, so take the first Ready control plane node
+	// rather than blindly using the first item in the list
+	debug_node := ""
+	for _, node := range nodes.Items {
+		if nodeIsReady(node) {
+			debug_node = node.Name
+			break
+		}
+	}
+	if debug_node == "" {
+		fmt.Printf("No Ready nodes found with the label: %s=\n", masterNodeLabel)
+		return
+	}
 	if *debug {
 		fmt.Printf("%s using node: %s\n", debug_header, debug_node)
 	}
@@ -787,27 +952,37 @@ func main() {
 	createProject(backupProject, serviceAccountName, *debug, debug_header, client)
 
 	// make sure the PV exists
-	backupJob := createBackupPodNoPVC(debug_node, backupProject, imageURL, jobName, serviceAccountName, *taintName, *debug, debug_header)
+	// only the job spec that is actually going to be submitted is built
+	var backupJob *batchv1.Job
 	if *usePVC {
-		// make sure the pv exists
-		if *useNFS {
-			fmt.Println("Checking to see if we need to create PV")
-			createPersistentNFSVolume(backupProject, *nfsServer, *nfsPath, *debug, debug_header, *nfsPVName, *nfsPVCName, client)
-		}
-		// make sure the pvc exists
+		// The NFS and dynamic claims are independent of each other and each one can spend up to 100 seconds
+		// waiting to be bound, so prepare them at the same time rather than one after the other
+		var pvcSetup sync.WaitGroup
 		fmt.Println("Checking to see if we need to create PVC")
 		if *useNFS {
-			if *debug {
-				fmt.Printf("%s Creating NFS PVC\n", debug_header)
-			}
-			createMissingPVCs(backupProject, *nfsPVCName, *nfsPVName, pvcSize, *debug, debug_header, client)
+			pvcSetup.Add(1)
+			go func() {
+				defer pvcSetup.Done()
+				// make sure the pv exists before the pvc which binds to it
+				fmt.Println("Checking to see if we need to create PV")
+				createPersistentNFSVolume(backupProject, *nfsServer, *nfsPath, *debug, debug_header, *nfsPVName, *nfsPVCName, client)
+				if *debug {
+					fmt.Printf("%s Creating NFS PVC\n", debug_header)
+				}
+				createMissingPVCs(backupProject, *nfsPVCName, *nfsPVName, pvcSize, *debug, debug_header, client)
+			}()
 		}
 		if *useDynamicStorage {
-			if *debug {
-				fmt.Printf("%s Creating Dynamic Storage PVC\n", debug_header)
-			}
-			createMissingPVCs(backupProject, *dynamicPVCName, "", pvcSize, *debug, debug_header, client)
+			pvcSetup.Add(1)
+			go func() {
+				defer pvcSetup.Done()
+				if *debug {
+					fmt.Printf("%s Creating Dynamic Storage PVC\n", debug_header)
+				}
+				createMissingPVCs(backupProject, *dynamicPVCName, "", pvcSize, *debug, debug_header, client)
+			}()
 		}
+		pvcSetup.Wait()
 		fmt.Println("Creating the backup job")
 		if *debug {
 			if *useNFS {
@@ -815,6 +990,8 @@ func main() {
 			}
 		}
 		backupJob = createBackupPodWithPVC(debug_node, backupProject, imageURL, *nfsPVCName, *dynamicPVCName, jobName, serviceAccountName, *taintName, *debug, debug_header)
+	} else {
+		backupJob = createBackupPodNoPVC(debug_node, backupProject, imageURL, jobName, serviceAccountName, *taintName, *debug, debug_header)
 	}
 
 	_, backupJobError := client.BatchV1().Jobs(backupProject).Create(context.TODO(), backupJob, metav1.CreateOptions{})
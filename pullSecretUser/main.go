@@ -5,8 +5,11 @@ import (
 	"encoding/json"
 	"flag"
 	"fmt"
+	"os"
 	"strings"
+	"sync"
 
+	apierrors "k8s.io/apimachinery/pkg/api/errors"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/client-go/kubernetes"
 	"k8s.io/client-go/tools/clientcmd"
@@ -16,6 +19,65 @@ import (
 // which have the a specified username inside them (generally a pull secret)
 // this can be very slow as it introspects all of the secrets in the cluster
 
+// dockerConfig holds the parts of a pull secret we inspect
+// json structure {"auths":{"<repo>":{"username":"faker","password":"snoogy","email":"admin@me.com","auth":"ZmF2d5"}}}
+// decoding into structs means the auth and email fields are skipped rather than built into generic maps
+type dockerConfig struct {
+	Auths map[string]dockerAuth `json:"auths"`
+}
+
+type dockerAuth struct {
+	Username string `json:"username"`
+	Password string `json:"password"`
+}
+
+func inspectProjectSecrets(projectName string, serviceAccountName string, firstDataType string, secondDataType string, debug bool, debugHeader string, client *kubernetes.Clientset) {
+	// get all the secrets in the given namespace and print any pull secret which contains the username
+	// the secrets are fetched in pages so a project with a lot of large secrets is never held in memory all at once
+	listOptions := metav1.ListOptions{Limit: 500}
+	for {
+		all_secrets, listSecretsError := client.CoreV1().Secrets(projectName).List(context.TODO(), listOptions)
+		// the typed client hands back an empty list on error, which would otherwise look like the last page
+		// a continue token only lives for a few minutes, once it has expired the rest of the project can't be fetched
+		if apierrors.IsResourceExpired(listSecretsError) {
+			fmt.Printf("The list of secrets in project %s expired while paging through it, not every secret was inspected\n", projectName)
+			return
+		}
+		if listSecretsError != nil {
+			fmt.Printf("Failed to list secrets in project %s: %s\n", projectName, listSecretsError)
+			return
+		}
+		for _, secretsInfo := range all_secrets.Items {
+			if debug != false {
+				fmt.Printf("%s      Project: %s Secret is: %s", debugHeader, projectName, secretsInfo.Name)
+			}
+			// the list already carries the full secret including its data, so there is no need to GET it again
+			for secretsKey, secretValue := range secretsInfo.Data {
+				if strings.Contains(secretsKey, firstDataType) || strings.Contains(secretsKey, secondDataType) {
+					var result dockerConfig
+					// Some maps may be empty, we want to ignore them as they wont have the keys we are looking for
+					if json.Unmarshal(secretValue, &result) != nil || result.Auths == nil {
+						if debug != false {
+							fmt.Printf("%s   WARNING!!  %s   has unexpected format", debugHeader, secretsInfo.Name)
+						}
+						continue
+					}
+					for _, repoAuth := range result.Auths {
+						if len(repoAuth.Username) != 0 && strings.EqualFold(repoAuth.Username, serviceAccountName) {
+							fmt.Printf("\n\nSecret Name: %s \n   Project Name: %s \n   Username: %s \n   Password %s\n", secretsInfo.Name, projectName, repoAuth.Username, repoAuth.Password)
+						}
+					}
+				}
+			}
+		}
+		// an empty continue token means that was the last page
+		if all_secrets.Continue == "" {
+			break
+		}
+		listOptions.Continue = all_secrets.Continue
+	}
+}
+
 func main() {
 	// Get the command line arguments from the user
 	serviceAccountName := flag.String("service-account", "deployer", "The name of the service account to find.")
@@ -23,26 +85,48 @@ func main() {
 	firstDataType := flag.String("first-data-type", "dockerconfigjson", "The heading of the in the 'data' section of the secret you wish to inspect")
 	secondDataType := flag.String("second-data-type", "", "The heading of the in the 'data' section of the secret you wish to inspect")
 	ignoreOpenShiftProjects := flag.Bool("ignore-openshift", true, "Ignores the Openshift-* projects to speed things up")
+	parallelProjects := flag.Int("parallel-projects", 10, "How many projects to inspect at the same time")
 	debug := flag.Bool("debug", false, "Turns on some debug messages")
 	flag.Parse()
 
 	debugHeader := "\n(( DEBUG )) -->"
 
-	// If no kubeconfig is passed in, attempt to find it in a default location
-	if *kubeConfigFile == "" {
-		*kubeConfigFile = "${USER}/.kube/auth/kubeconfig"
+	// at least one project has to be inspected at a time, otherwise handing out the first slot blocks forever
+	if *parallelProjects < 1 {
+		flag.Usage()
+		fmt.Println("")
+		fmt.Println("!!! -parallel-projects must be 1 or more !!!")
+		os.Exit(1)
+	}
+
+	// If no kubeconfig is passed in, use $KUBECONFIG or attempt to find it in a default location
+	loadingRules := clientcmd.NewDefaultClientConfigLoadingRules()
+	if *kubeConfigFile == "" && os.Getenv(clientcmd.RecommendedConfigPathEnvVar) == "" {
 		fmt.Println("No kubeconfig attempting to use ~/.kube/auth/kubeconfig")
+		homeDir, homeDirError := os.UserHomeDir()
+		if homeDirError != nil {
+			fmt.Printf("Could not find the home directory (%s), pass -kube-config or set KUBECONFIG\n", homeDirError)
+			os.Exit(1)
+		}
+		*kubeConfigFile = homeDir + "/.kube/auth/kubeconfig"
+	}
+	if *kubeConfigFile != "" {
+		loadingRules.ExplicitPath = *kubeConfigFile
 	}
 
-	config, err := clientcmd.BuildConfigFromFlags("", *kubeConfigFile)
+	config, err := clientcmd.NewNonInteractiveDeferredLoadingClientConfig(loadingRules, &clientcmd.ConfigOverrides{}).ClientConfig()
 
 	if err != nil {
 		panic(err)
 	}
 	client, _ := kubernetes.NewForConfig(config)
 	// get all the namespaces so that we can loop over the secrets in that project
-	namespaces, _ := client.CoreV1().Namespaces().List(context.TODO(), metav1.ListOptions{})
+	namespaces, _ := client.CoreV1().Namespaces().List(context.TODO(), metav1.ListOptions{ResourceVersion: "0"})
 
+	// Each project is inspected in its own goroutine so the API round-trips overlap
+	// the semaphore keeps the number of projects being inspected at once bounded
+	var wg sync.WaitGroup
+	semaphore := make(chan struct{}, *parallelProjects)
 	for _, projectInfo := range namespaces.Items {
 		// get all the secrets in the current namespace
 		if *debug != false {
@@ -51,61 +135,13 @@ func main() {
 		if *ignoreOpenShiftProjects == true && strings.Contains(projectInfo.Name, "openshift") {
 			continue
 		}
-		all_secrets, _ := client.CoreV1().Secrets(projectInfo.Name).List(context.TODO(), metav1.ListOptions{})
-		for _, secretsInfo := range all_secrets.Items {
-			if *debug != false {
-				fmt.Printf("%s      Secret is: %s", debugHeader, secretsInfo.Name)
-			}
-			individual_secret, _ := client.CoreV1().Secrets(projectInfo.Name).Get(context.TODO(), secretsInfo.Name, metav1.GetOptions{})
-
-			for secretsKey, secretValue := range individual_secret.Data {
-				if strings.Contains(secretsKey, *firstDataType) || strings.Contains(secretsKey, *secondDataType) {
-					var result map[string]interface{}
-					json.Unmarshal([]byte(secretValue), &result)
-					// json structure {"auths":{"<repo>":{"username":"faker","password":"snoogy","email":"admin@me.com","auth":"ZmF2d5"}}}
-					// Some maps may be empty, we want to ignore them as they wont have the keys we are looking for
-					auths, ok := result["auths"].(map[string]interface{})
-
-					if !ok {
-						if *debug != false {
-							fmt.Printf("%s   WARNING!!  %s   has unexpected format", debugHeader, secretsInfo.Name)
-							continue
-						}
-						continue
-					} else {
-
-						for _, val := range auths {
-							unknownRepo, ok := val.(map[string]interface{})
-							if !ok {
-								if *debug != false {
-									fmt.Printf("%s   WARNING!!  %s   has unexpected format", debugHeader, secretsInfo.Name)
-									continue
-								}
-								continue
-							} else {
-								var foundUsername string
-								var password string
-								for authHeadings, authValues := range unknownRepo {
-									if strings.Contains(authHeadings, "username") {
-										unknownUser := fmt.Sprintf("%v", authValues)
-										if strings.ToLower(unknownUser) == strings.ToLower(*serviceAccountName) {
-											foundUsername = unknownUser
-										}
-									}
-									if strings.Contains(authHeadings, "password") {
-										password = fmt.Sprintf("%v", authValues)
-									}
-
-								}
-								if len(foundUsername) != 0 {
-									fmt.Printf("\n\nSecret Name: %s \n   Project Name: %s \n   Username: %s \n   Password %s\n", secretsInfo.Name, projectInfo.Name, foundUsername, password)
-								}
-							}
-						}
-					}
-				}
-
-			}
-		}
+		wg.Add(1)
+		semaphore <- struct{}{}
+		go func(projectName string) {
+			defer wg.Done()
+			defer func() { <-semaphore }()
+			inspectProjectSecrets(projectName, *serviceAccountName, *firstDataType, *secondDataType, *debug, debugHeader, client)
+		}(projectInfo.Name)
 	}
+	wg.Wait()
 }
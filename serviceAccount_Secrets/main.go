@@ -4,11 +4,15 @@ import (
 	"context"
 	"flag"
 	"fmt"
+	"os"
 	"strings"
 
+	corev1 "k8s.io/api/core/v1"
+	apierrors "k8s.io/apimachinery/pkg/api/errors"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 
 	"k8s.io/client-go/kubernetes"
+	"k8s.io/client-go/metadata"
 	"k8s.io/client-go/tools/clientcmd"
 )
 
@@ -17,42 +21,106 @@ import (
 // This relies on the annotations in the service account in order to exclude
 // Secrets that we don't care about
 
+func printServiceAccountSecrets(namespaceName string, serviceAccountName string, metadataClient metadata.Interface) error {
+	// Prints every secret in the namespace that belongs to the service account
+	// metav1.NamespaceAll lists the secrets across all namespaces, every item carries its namespace so the openshift projects can still be skipped here
+	secretsResource := corev1.SchemeGroupVersion.WithResource("secrets")
+	// the list is fetched in pages so the whole cluster's secrets are never held in memory all at once
+	listOptions := metav1.ListOptions{Limit: 500}
+	for {
+		// unlike the typed client, the metadata client hands back a nil list on error so it has to be checked before it is used
+		all_secrets, listSecretsError := metadataClient.Resource(secretsResource).Namespace(namespaceName).List(context.TODO(), listOptions)
+		// a continue token only lives for a few minutes, once it has expired the rest of the list can't be fetched
+		// restarting would print the secrets already shown a second time so report it instead
+		if apierrors.IsResourceExpired(listSecretsError) {
+			return fmt.Errorf("the list of secrets expired while paging through it, secrets after those shown were not checked: %w", listSecretsError)
+		}
+		if listSecretsError != nil {
+			return listSecretsError
+		}
+		for _, secretsInfo := range all_secrets.Items {
+			// Skip over the openshift projects by default
+			if strings.Contains(secretsInfo.Namespace, "openshift") {
+				continue
+			}
+			// Look the service-account annotation up directly rather than walking every annotation on the secret
+			// If the secret has the annotation and it contains the desired service account name
+			// print out the information
+			serviceValue, ok := secretsInfo.Annotations[corev1.ServiceAccountNameKey]
+			if ok && strings.Contains(serviceValue, serviceAccountName) {
+				fmt.Printf("Namespace: %s \n Secret: %s \n Account Name: %s \n", secretsInfo.Namespace, secretsInfo.Name, serviceAccountName)
+			}
+		}
+		// an empty continue token means that was the last page
+		if all_secrets.Continue == "" {
+			return nil
+		}
+		listOptions.Continue = all_secrets.Continue
+	}
+}
+
 func main() {
 	// Get the command line arguments from the user
 	serviceAccountName := flag.String("service-account", "deployer", "The name of the service account to find.")
 	kubeConfigFile := flag.String("kube-config", "", "Full path to kubeconfig")
 	flag.Parse()
 
-	// If no kubeconfig is passed in, attempt to find it in a default location
-	if *kubeConfigFile == "" {
-		*kubeConfigFile = "~/.kube/auth/kubeconfig"
+	// If no kubeconfig is passed in, use $KUBECONFIG or attempt to find it in a default location
+	loadingRules := clientcmd.NewDefaultClientConfigLoadingRules()
+	if *kubeConfigFile == "" && os.Getenv(clientcmd.RecommendedConfigPathEnvVar) == "" {
 		fmt.Println("No kubeconfig attempting to use ~/.kube/auth/kubeconfig")
+		homeDir, homeDirError := os.UserHomeDir()
+		if homeDirError != nil {
+			fmt.Printf("Could not find the home directory (%s), pass -kube-config or set KUBECONFIG\n", homeDirError)
+			os.Exit(1)
+		}
+		*kubeConfigFile = homeDir + "/.kube/auth/kubeconfig"
 	}
-	config, err := clientcmd.BuildConfigFromFlags("", *kubeConfigFile)
+	if *kubeConfigFile != "" {
+		loadingRules.ExplicitPath = *kubeConfigFile
+	}
+
+	config, err := clientcmd.NewNonInteractiveDeferredLoadingClientConfig(loadingRules, &clientcmd.ConfigOverrides{}).ClientConfig()
+
+	if err != nil {
+		panic(err)
+	}
+	// Only the names and annotations of the secrets are looked at, so list them through the metadata client
+	// The API server then returns PartialObjectMetadata and the secret data never goes over the wire
+	metadataClient, err := metadata.NewForConfig(config)
 
 	if err != nil {
+		fmt.Println("Failed to create the metadata client")
 		panic(err)
 	}
-	client, _ := kubernetes.NewForConfig(config)
-	// get all the namespaces so that we can loop over the secrets in that project
-	namespaces, _ := client.CoreV1().Namespaces().List(context.TODO(), metav1.ListOptions{})
-
-	for _, projectInfo := range namespaces.Items {
-		// Skip over the openshift projects by default
-		if strings.Contains(projectInfo.Name, "openshift") {
-
-		} else {
-			all_secrets, _ := client.CoreV1().Secrets(projectInfo.Name).List(context.TODO(), metav1.ListOptions{})
-			for _, secretsInfo := range all_secrets.Items {
-				for key, serviceValue := range secretsInfo.Annotations {
-					// If the line has both service-account annotation and contains the desired service account name
-					// print out the information
-					// because serviceAccountName is an argument, use a pointer to refer to it
-					if strings.Contains(key, "service-account.name") && strings.Contains(serviceValue, *serviceAccountName) {
-						fmt.Printf("Namespace: %s \n Secret: %s \n Account Name: %s \n", projectInfo.Name, secretsInfo.Name, *serviceAccountName)
-					}
-				}
+	// Listing the secrets across all namespaces in one call needs cluster wide permission to list secrets
+	// a user who can only read some namespaces is refused, so fall back to checking the namespaces one at a time
+	listSecretsError := printServiceAccountSecrets(metav1.NamespaceAll, *serviceAccountName, metadataClient)
+	if apierrors.IsForbidden(listSecretsError) {
+		fmt.Println("Not allowed to list secrets across all namespaces, checking each namespace instead")
+		client, err := kubernetes.NewForConfig(config)
+
+		if err != nil {
+			panic(err)
+		}
+		// get all the namespaces so that we can loop over the secrets in that project
+		namespaces, listNamespacesError := client.CoreV1().Namespaces().List(context.TODO(), metav1.ListOptions{ResourceVersion: "0"})
+		if listNamespacesError != nil {
+			fmt.Println("Failed to list namespaces")
+			panic(listNamespacesError)
+		}
+		for _, projectInfo := range namespaces.Items {
+			// Skip over the openshift projects by default
+			if strings.Contains(projectInfo.Name, "openshift") {
+				continue
+			}
+			// a namespace we can't read is reported and skipped so the rest are still checked
+			if listSecretsError := printServiceAccountSecrets(projectInfo.Name, *serviceAccountName, metadataClient); listSecretsError != nil {
+				fmt.Printf("Failed to list secrets in namespace %s: %s\n", projectInfo.Name, listSecretsError)
 			}
 		}
+	} else if listSecretsError != nil {
+		fmt.Printf("Failed to list secrets: %s\n", listSecretsError)
+		os.Exit(1)
 	}
 }